@@ -10,12 +10,18 @@ Licensed under the MIT License - see LICENSE file for details.
 """
 
 import asyncio
+import io
+import itertools
 import os
 import logging
-from typing import Any, Dict, List, Optional, Union
-from urllib.parse import urljoin
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, List, Literal, Mapping, NamedTuple, Optional, Tuple, Union
+from urllib.parse import urlencode
 
 import httpx
+import orjson
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.types import ServerCapabilities, ToolsCapability
@@ -24,26 +30,123 @@ from mcp.types import (
     Resource,
     Tool,
     TextContent,
+    TextResourceContents,
     ImageContent,
     EmbeddedResource,
     LoggingLevel
 )
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+try:
+    import uvloop
+except ImportError:  # Optional speedup; not available on Windows
+    uvloop = None
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# GraphQL query for search
+_SEARCH_QUERY = """
+query Search($query: String!, $version: SearchVersion!, $patternType: SearchPatternType!) {
+  search(query: $query, version: $version, patternType: $patternType) {
+    results {
+      results {
+        ... on FileMatch {
+          __typename
+          file {
+            path
+          }
+          repository {
+            name
+          }
+          lineMatches {
+            preview
+            lineNumber
+          }
+        }
+        ... on Repository {
+          __typename
+          name
+          description
+        }
+        ... on CommitSearchResult {
+          __typename
+          commit {
+            oid
+            message
+            author {
+              person {
+                name
+              }
+            }
+          }
+        }
+      }
+      limitHit
+      cloning {
+        name
+      }
+      missing {
+        name
+      }
+      timedout {
+        name
+      }
+      matchCount
+      alert {
+        title
+      }
+    }
+    stats {
+      approximateResultCount
+    }
+  }
+}
+"""
+
+# Constant search variables per pattern type, mapped to the API's enum values
+_SEARCH_VARIABLES = {
+    "keyword": {"version": "V3", "patternType": "standard"},
+    "regexp": {"version": "V3", "patternType": "regexp"},
+}
+
+def _apply_count_limit(query: str, count: int) -> str:
+    """Add a count limit to the query unless it already specifies one."""
+    if count and count > 0 and 'count:' not in query:
+        return f"{query} count:{count}"
+    return query
+
 class SourcegraphClient:
     """Client for interacting with Sourcegraph GraphQL API."""
     
     def __init__(self, base_url: str, access_token: str):
         self.base_url = base_url.rstrip('/')
         self.access_token = access_token
-        self.graphql_url = urljoin(self.base_url + '/', '.api/graphql')
+        # Resolved against base_url by the client
+        self.graphql_path = '.api/graphql'
+        
+        # Long-lived client so connections (and TLS sessions) are pooled
+        # across searches instead of being re-established on every call.
+        # All traffic goes to one host, so the pool is sized for that host
+        # and idle connections are kept warm between bursts of searches.
+        # Limits are passed to the client rather than a custom transport so
+        # they also apply to proxy transports configured from the environment.
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=8,
+                max_keepalive_connections=8,
+                keepalive_expiry=60.0
+            ),
+            headers={
+                "Authorization": f"token {access_token}",
+                "Content-Type": "application/json",
+            },
+        )
+        
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        await self._client.aclose()
         
     async def search(
         self,
@@ -65,128 +168,117 @@ class SourcegraphClient:
             Dictionary containing search results and metadata
         """
         
-        # GraphQL query for search
-        graphql_query = """
-        query Search($query: String!, $version: SearchVersion!, $patternType: SearchPatternType!) {
-          search(query: $query, version: $version, patternType: $patternType) {
-            results {
-              results {
-                ... on FileMatch {
-                  __typename
-                  file {
-                    name
-                    path
-                    url
-                  }
-                  repository {
-                    name
-                    url
-                  }
-                  lineMatches {
-                    preview
-                    lineNumber
-                    offsetAndLengths
-                  }
-                }
-                ... on Repository {
-                  __typename
-                  name
-                  url
-                  description
-                }
-                ... on CommitSearchResult {
-                  __typename
-                  commit {
-                    oid
-                    message
-                    url
-                    author {
-                      person {
-                        name
-                        email
-                      }
-                    }
-                  }
-                }
-              }
-              limitHit
-              cloning {
-                name
-              }
-              missing {
-                name
-              }
-              timedout {
-                name
-              }
-              matchCount
-              approximateResultCount
-              alert {
-                title
-                description
-              }
-            }
-            stats {
-              approximateResultCount
-              sparkline
-            }
-          }
+        query = _apply_count_limit(query, count)
+        
+        template = _SEARCH_VARIABLES.get(pattern_type) or _SEARCH_VARIABLES["keyword"]
+        variables = {"query": query, **template}
+        
+        payload = {
+            "query": _SEARCH_QUERY,
+            "variables": variables
         }
+        
+        try:
+            response = await self._client.post(
+                self.graphql_path,
+                content=orjson.dumps(payload),
+                timeout=timeout
+            )
+            response.raise_for_status()
+            
+            data = orjson.loads(response.content)
+            
+            if "errors" in data:
+                logger.error("GraphQL errors: %s", data['errors'])
+                raise Exception(f"GraphQL errors: {data['errors']}")
+            
+            search = data["data"]["search"]
+            
+            # Only the first `count` results are ever formatted, so drop the
+            # rest rather than keep them alive in the response cache
+            result_items = (search.get("results") or {}).get("results")
+            if count and result_items and len(result_items) > count:
+                del result_items[count:]
+                
+            return search
+            
+        except httpx.TimeoutException as e:
+            logger.error("Search timeout after %s seconds: %s", timeout, e)
+            raise Exception(f"Search timeout after {timeout} seconds")
+        except httpx.HTTPError as e:
+            logger.error("HTTP error during search: %s", e)
+            raise Exception(f"HTTP error: {e}")
+        except Exception as e:
+            logger.error("Unexpected error during search: %s", e, exc_info=True)
+            raise Exception(f"Search failed: {e}")
+    
+    async def search_many(
+        self,
+        queries: List[str],
+        pattern_type: str = "keyword",
+        count: int = 10,
+        timeout: int = 10
+    ) -> List[Dict[str, Any]]:
         """
+        Execute several search queries concurrently.
         
-        # Add count limit to query if specified
-        if count and count > 0:
-            if 'count:' not in query:
-                query = f"{query} count:{count}"
+        The searches share the pooled HTTP/2 connection, so they are
+        multiplexed rather than run back to back.
         
-        # Map pattern type to correct enum values
-        pattern_type_map = {
-            "keyword": "standard",
-            "regexp": "regexp"
-        }
+        Args:
+            queries: Search query strings with Sourcegraph syntax
+            pattern_type: "keyword" or "regexp"
+            count: Maximum number of results per query
+            timeout: Search timeout in seconds per query
+            
+        Returns:
+            List of search results in the same order as queries
+        """
+        return list(await asyncio.gather(*(
+            self.search(query, pattern_type=pattern_type, count=count, timeout=timeout)
+            for query in queries
+        )))
+
+class SearchCache:
+    """Bounded TTL cache for search responses, evicting oldest entries first."""
+    
+    def __init__(self, max_size: int = 128, ttl: float = 60.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        # Accessed only from the event loop thread and never across an
+        # await, so no lock is needed
+        self._entries: "OrderedDict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]]" = OrderedDict()
         
-        variables = {
-            "query": query,
-            "version": "V3",
-            "patternType": pattern_type_map.get(pattern_type, "standard")
-        }
+    def get(self, key: Tuple[Any, ...]) -> Optional[Dict[str, Any]]:
+        """Return the cached response for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
         
-        headers = {
-            "Authorization": f"token {self.access_token}",
-            "Content-Type": "application/json",
-        }
+        stored_at, results = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
         
-        payload = {
-            "query": graphql_query,
-            "variables": variables
-        }
+        return results
         
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            try:
-                response = await client.post(
-                    self.graphql_url,
-                    json=payload,
-                    headers=headers
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                if "errors" in data:
-                    logger.error(f"GraphQL errors: {data['errors']}")
-                    raise Exception(f"GraphQL errors: {data['errors']}")
-                    
-                return data["data"]["search"]
-                
-            except httpx.TimeoutException as e:
-                logger.error(f"Search timeout after {timeout} seconds: {e}")
-                raise Exception(f"Search timeout after {timeout} seconds")
-            except httpx.HTTPError as e:
-                logger.error(f"HTTP error during search: {e}")
-                raise Exception(f"HTTP error: {e}")
-            except Exception as e:
-                logger.error(f"Unexpected error during search: {e}", exc_info=True)
-                raise Exception(f"Search failed: {e}")
+    def set(self, key: Tuple[Any, ...], results: Dict[str, Any]) -> None:
+        """Store a response, evicting the oldest entry when full."""
+        self._entries[key] = (time.monotonic(), results)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+class SearchArgs(BaseModel):
+    """Validated arguments for the search tool."""
+    
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
+    query: str = Field(min_length=1)
+    pattern_type: Literal["keyword", "regexp"] = "keyword"
+    count: int = Field(default=10, ge=1, le=1000)
+    timeout: int = Field(default=10, ge=5, le=60)
+    response_format: Literal["text", "json"] = "text"
 
 # Initialize the MCP server
 server = Server("sourcegraph")
@@ -194,6 +286,9 @@ server = Server("sourcegraph")
 # Global client instance
 sourcegraph_client: Optional[SourcegraphClient] = None
 
+# Responses for repeated searches within a session
+search_cache = SearchCache()
+
 @server.list_tools()
 async def handle_list_tools() -> List[Tool]:
     """List available tools."""
@@ -266,6 +361,12 @@ Search code across repositories using Sourcegraph's powerful search syntax.
                         "minimum": 5,
                         "maximum": 60,
                         "description": "Search timeout in seconds"
+                    },
+                    "response_format": {
+                        "type": "string",
+                        "enum": ["text", "json"],
+                        "default": "text",
+                        "description": "'text' for a formatted summary, 'json' for the raw search response as an embedded application/json resource"
                     }
                 },
                 "required": ["query"]
@@ -273,8 +374,141 @@ Search code across repositories using Sourcegraph's powerful search syntax.
         )
     ]
 
+class FileMatchRecord(NamedTuple):
+    """Fields of a FileMatch result that the formatter consumes."""
+    path: str
+    repo: str
+    line_matches: List[Tuple[int, str]]  # (line number, preview), first three only
+    match_count: int
+
+class RepositoryRecord(NamedTuple):
+    """Fields of a Repository result that the formatter consumes."""
+    name: str
+    description: str
+
+class CommitRecord(NamedTuple):
+    """Fields of a CommitSearchResult result that the formatter consumes."""
+    oid: str
+    message: str
+    author: str
+
+SearchRecord = Union[FileMatchRecord, RepositoryRecord, CommitRecord]
+
+# Shared read-only stand-in for missing or null nested objects
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+def _parse_file_match(result: Dict[str, Any]) -> FileMatchRecord:
+    rget = result.get
+    line_matches = rget("lineMatches") or ()
+    
+    head = []
+    for match in itertools.islice(line_matches, 3):
+        mget = match.get
+        head.append((mget("lineNumber") or 0, mget("preview") or ""))
+    
+    return FileMatchRecord(
+        path=(rget("file") or _EMPTY).get("path") or "Unknown",
+        repo=(rget("repository") or _EMPTY).get("name") or "Unknown",
+        line_matches=head,
+        match_count=len(line_matches)
+    )
+
+def _parse_repo(result: Dict[str, Any]) -> RepositoryRecord:
+    rget = result.get
+    return RepositoryRecord(
+        name=rget("name") or "Unknown",
+        description=rget("description") or ""
+    )
+
+def _parse_commit(result: Dict[str, Any]) -> CommitRecord:
+    commit = result.get("commit") or _EMPTY
+    cget = commit.get
+    person = (cget("author") or _EMPTY).get("person") or _EMPTY
+    return CommitRecord(
+        oid=cget("oid") or "Unknown",
+        message=cget("message") or "",
+        author=person.get("name") or "Unknown"
+    )
+
+# Record parsers keyed by GraphQL __typename
+_PARSERS = {
+    "FileMatch": _parse_file_match,
+    "Repository": _parse_repo,
+    "CommitSearchResult": _parse_commit,
+}
+
+def _parse_result(result: Dict[str, Any]) -> Optional[SearchRecord]:
+    """Flatten a raw search result into a record, or None for unknown types."""
+    parse = _PARSERS.get(result.get("__typename"))
+    return parse(result) if parse else None
+
+_ELLIPSIS = "..."
+
+def _cap(text: str, limit: int) -> str:
+    """Truncate text to at most limit characters, ending with an ellipsis."""
+    if len(text) <= limit:
+        return text
+    return text[:limit - 3] + _ELLIPSIS
+
+def _fmt_file_match(i: int, rec: FileMatchRecord, buf: io.StringIO) -> None:
+    """Write a FileMatch result block."""
+    write = buf.write
+    
+    # Compact single-line format with key info
+    write(f"{i}. {rec.path}\n   Repository: {rec.repo}\n")
+    
+    # Show most relevant line match with better context
+    if rec.line_matches:
+        line_num, preview = rec.line_matches[0]  # First match is usually most relevant
+        # Clean up preview for better readability
+        preview = _cap(preview.strip(), 120)
+        write(f"   Line {line_num}: {preview}\n")
+        
+        # Show up to 2 more matches more compactly
+        for line_num, preview in itertools.islice(rec.line_matches, 1, None):
+            preview = _cap(preview.strip(), 80)
+            write(f"   Line {line_num}: {preview}\n")
+        
+        if rec.match_count > 3:
+            write(f"   ... +{rec.match_count - 3} more matches\n")
+
+def _fmt_repo(i: int, rec: RepositoryRecord, buf: io.StringIO) -> None:
+    """Write a Repository result block."""
+    # Repository result - keep concise
+    buf.write(f"{i}. Repository: {rec.name}\n")
+    if rec.description and len(rec.description) < 100:
+        buf.write(f"   {rec.description}\n")
+
+def _fmt_commit(i: int, rec: CommitRecord, buf: io.StringIO) -> None:
+    """Write a CommitSearchResult result block."""
+    # Truncate long commit messages
+    message = _cap(rec.message.strip(), 80)
+    
+    buf.write(
+        f"{i}. Commit: {rec.oid[:8]}\n"
+        f"   {message}\n"
+        f"   Author: {rec.author}\n"
+    )
+
+# Result formatters keyed by record type
+_FORMATTERS = {
+    FileMatchRecord: _fmt_file_match,
+    RepositoryRecord: _fmt_repo,
+    CommitRecord: _fmt_commit,
+}
+
+def _format_results(records: List[Optional[SearchRecord]], buf: io.StringIO) -> None:
+    """Write numbered result blocks, each followed by a blank separator line."""
+    # Bind hot lookups to locals once for the whole loop
+    write = buf.write
+    formatters = _FORMATTERS
+    for i, rec in enumerate(records, 1):
+        if rec is not None:
+            formatters[type(rec)](i, rec, buf)
+        write("\n")
+
 @server.call_tool()
-async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
+async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[Union[TextContent, EmbeddedResource]]:
     """Handle tool calls."""
     if name != "search":
         raise ValueError(f"Unknown tool: {name}")
@@ -282,44 +516,74 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextCon
     if not sourcegraph_client:
         raise ValueError("Sourcegraph client not initialized. Please check SOURCEGRAPH_URL and SOURCEGRAPH_TOKEN environment variables.")
     
-    query = arguments.get("query", "")
-    if not query:
-        raise ValueError("Query parameter is required")
-        
-    pattern_type = arguments.get("pattern_type", "keyword")
-    
     try:
-        count = int(arguments.get("count", 10))
-        timeout = int(arguments.get("timeout", 10))
-    except (ValueError, TypeError) as e:
-        error_msg = f"Invalid parameter types - count: {arguments.get('count')}, timeout: {arguments.get('timeout')}"
-        logger.error(error_msg, exc_info=True)
-        raise ValueError(f"Invalid parameter types: {e}")
+        args = SearchArgs.model_validate(arguments)
+    except ValidationError as e:
+        logger.error("Invalid search arguments: %s", e)
+        raise ValueError(f"Invalid parameters: {e}")
+    
+    query = args.query
+    pattern_type = args.pattern_type
+    count = args.count
+    timeout = args.timeout
     
-    logger.info(f"Search: '{query[:50]}{'...' if len(query) > 50 else ''}' [count={count}, timeout={timeout}s]")
+    logger.info(
+        "Search: '%s%s' [count=%d, timeout=%ds]",
+        query[:50], '...' if len(query) > 50 else '', count, timeout
+    )
     
     try:
-        results = await sourcegraph_client.search(
-            query=query,
-            pattern_type=pattern_type,
-            count=count,
-            timeout=timeout
-        )
+        # Key on the canonical query so "foo" and "foo count:10" share an entry
+        canonical_query = _apply_count_limit(query, count)
+        cache_key = (canonical_query, pattern_type, count)
+        results = search_cache.get(cache_key)
         
-        # Log search completion
-        result_count = len(results.get("results", {}).get("results", []))
-        logger.info(f"Search completed: {result_count} results returned")
+        if results is None:
+            results = await sourcegraph_client.search(
+                query=canonical_query,
+                pattern_type=pattern_type,
+                count=count,
+                timeout=timeout
+            )
+            
+            # Don't cache partial answers, so retrying with a longer timeout
+            # (or once repos finish cloning) actually reaches Sourcegraph
+            partial = results.get("results") or _EMPTY
+            if not (partial.get("timedout") or partial.get("cloning")):
+                search_cache.set(cache_key, results)
+            
+            # Log search completion
+            result_count = len((results.get("results") or _EMPTY).get("results") or ())
+            logger.info("Search completed: %d results returned", result_count)
+        else:
+            logger.info("Search served from cache")
+        
+        # Hand back the raw response and skip formatting entirely
+        if args.response_format == "json":
+            search_url = f"{sourcegraph_client.base_url}/search?" + urlencode({
+                "q": canonical_query,
+                "patternType": _SEARCH_VARIABLES[pattern_type]["patternType"],
+            })
+            return [EmbeddedResource(
+                type="resource",
+                resource=TextResourceContents(
+                    uri=search_url,
+                    mimeType="application/json",
+                    text=orjson.dumps(results).decode()
+                )
+            )]
         
         # Format results for LLM consumption
-        output_lines = []
-        search_results = results.get("results", {})
+        buf = io.StringIO()
+        write = buf.write
+        search_results = results.get("results") or _EMPTY
         
         # Add compact search statistics
-        stats = results.get("stats", {})
-        result_items = search_results.get("results", [])
+        stats = results.get("stats") or _EMPTY
+        result_items = search_results.get("results") or ()
         
         if not result_items:
-            output_lines.append("No results found.")
+            write("No results found.\n")
         else:
             # More concise header with essential info
             approx_count = stats.get("approximateResultCount", len(result_items))
@@ -330,74 +594,12 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextCon
                 approx_count = len(result_items)
             
             if approx_count > len(result_items):
-                output_lines.append(f"Top {len(result_items)} of ~{approx_count} results:")
+                write(f"Top {len(result_items)} of ~{approx_count} results:\n\n")
             else:
-                output_lines.append(f"Found {len(result_items)} results:")
-            output_lines.append("")
+                write(f"Found {len(result_items)} results:\n\n")
             
-            for i, result in enumerate(result_items[:int(count)], 1):
-                result_type = result.get("__typename", "Unknown")
-                
-                if result_type == "FileMatch":
-                    # More structured and LLM-friendly file match format
-                    file_info = result.get("file", {})
-                    repo_info = result.get("repository", {})
-                    line_matches = result.get("lineMatches", [])
-                    
-                    # Compact single-line format with key info
-                    file_path = file_info.get('path', 'Unknown')
-                    repo_name = repo_info.get('name', 'Unknown')
-                    
-                    output_lines.append(f"{i}. {file_path}")
-                    output_lines.append(f"   Repository: {repo_name}")
-                    
-                    # Show most relevant line match with better context
-                    if line_matches:
-                        best_match = line_matches[0]  # First match is usually most relevant
-                        line_num = best_match.get("lineNumber", 0)
-                        preview = best_match.get("preview", "").strip()
-                        # Clean up preview for better readability
-                        if len(preview) > 120:
-                            preview = preview[:117] + "..."
-                        output_lines.append(f"   Line {line_num}: {preview}")
-                        
-                        # Show additional matches more compactly
-                        if len(line_matches) > 1:
-                            additional = min(2, len(line_matches) - 1)  # Show up to 2 more
-                            for match in line_matches[1:additional+1]:
-                                line_num = match.get("lineNumber", 0)
-                                preview = match.get("preview", "").strip()
-                                if len(preview) > 80:
-                                    preview = preview[:77] + "..."
-                                output_lines.append(f"   Line {line_num}: {preview}")
-                            
-                            if len(line_matches) > 3:
-                                output_lines.append(f"   ... +{len(line_matches) - 3} more matches")
-                        
-                elif result_type == "Repository":
-                    # Repository result - keep concise
-                    repo_name = result.get("name", "Unknown")
-                    description = result.get("description", "")
-                    
-                    output_lines.append(f"{i}. Repository: {repo_name}")
-                    if description and len(description) < 100:
-                        output_lines.append(f"   {description}")
-                        
-                elif result_type == "CommitSearchResult":
-                    # Commit result - more structured
-                    commit = result.get("commit", {})
-                    author = commit.get("author", {}).get("person", {})
-                    message = commit.get('message', '').strip()
-                    
-                    # Truncate long commit messages
-                    if len(message) > 80:
-                        message = message[:77] + "..."
-                    
-                    output_lines.append(f"{i}. Commit: {commit.get('oid', 'Unknown')[:8]}")
-                    output_lines.append(f"   {message}")
-                    output_lines.append(f"   Author: {author.get('name', 'Unknown')}")
-                
-                output_lines.append("")  # Separator between results
+            records = [_parse_result(r) for r in itertools.islice(result_items, count)]
+            _format_results(records, buf)
         
         # Add concise status information
         status_info = []
@@ -422,12 +624,18 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextCon
         
         # Add status info if any exists
         if status_info:
-            output_lines.append("Status: " + " | ".join(status_info))
+            write("Status: " + " | ".join(status_info) + "\n")
         
-        return [TextContent(type="text", text="\n".join(output_lines))]
+        # Drop the trailing newline so the output matches the previous
+        # "\n".join() layout exactly
+        return [TextContent(type="text", text=buf.getvalue()[:-1])]
         
     except Exception as e:
-        logger.error(f"Tool handler failed for query '{query[:30]}{'...' if len(query) > 30 else ''}': {e}", exc_info=True)
+        logger.error(
+            "Tool handler failed for query '%s%s': %s",
+            query[:30], '...' if len(query) > 30 else '', e,
+            exc_info=True
+        )
         return [TextContent(type="text", text=f"Search failed: {str(e)}")]
 
 async def main():
@@ -444,9 +652,9 @@ async def main():
     
     try:
         sourcegraph_client = SourcegraphClient(base_url, access_token)
-        logger.info(f"MCP Sourcegraph server started - {base_url}")
+        logger.info("MCP Sourcegraph server started - %s", base_url)
     except Exception as e:
-        logger.error(f"Failed to initialize Sourcegraph client: {e}", exc_info=True)
+        logger.error("Failed to initialize Sourcegraph client: %s", e, exc_info=True)
         raise
     
     # Run the server
@@ -467,11 +675,24 @@ async def main():
     except KeyboardInterrupt:
         logger.info("Server shutdown requested")
     except Exception as e:
-        logger.error(f"Server failed: {e}", exc_info=True)
+        logger.error("Server failed: %s", e, exc_info=True)
         raise
+    finally:
+        await sourcegraph_client.aclose()
 
 def cli_main():
     """CLI entry point that properly handles the async main function."""
+    if uvloop is not None:
+        uvloop.install()
+    
+    # Configure logging only when running standalone, leaving any host
+    # application's logging setup untouched
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+    
     asyncio.run(main())
 
 if __name__ == "__main__":